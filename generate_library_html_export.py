@@ -1,149 +1,397 @@
 import os
+import argparse
+import base64
 import mutagen
+from mutagen.mp3 import MP3
+from mutagen.id3 import ID3
+from mutagen.flac import FLAC
+from mutagen.easymp4 import EasyMP4
+from mutagen.oggvorbis import OggVorbis
+from mutagen.oggopus import OggOpus
+from mutagen.wave import WAVE
+from mutagen.asf import ASF
+from mutagen.aac import AAC
+from mutagen.aiff import AIFF
 import json
-from html import escape
+import logging
+import re
+import sqlite3
+import zlib
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+# Optional: faster JSON serialization for the embedded metadata
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Optional: shows a progress bar while metadata is read
+try:
+    from tqdm import tqdm
+except ImportError:
+    tqdm = None
+
+log = logging.getLogger(__name__)
+
+# File extensions handed to Mutagen; everything else is skipped without being opened
+AUDIO_EXTS = frozenset({'.mp3', '.flac', '.m4a', '.ogg', '.opus', '.wav', '.wma', '.aac', '.alac', '.aiff', '.ape'})
+
+# Parsers for common extensions so Mutagen doesn't have to sniff the header to pick one
+_PARSERS = {
+    '.mp3': MP3,
+    '.flac': FLAC,
+    '.m4a': EasyMP4,
+    '.ogg': OggVorbis,
+    '.opus': OggOpus,
+    '.wav': WAVE,
+    '.wma': ASF,
+    '.aac': AAC,
+    '.aiff': AIFF,
+}
+
+# Metadata cache written to the working directory; rescans only parse files whose mtime/size changed
+CACHE_FILE = ".audiolib_cache.sqlite"
+# Bump whenever extract_metadata's output changes so caches written by older versions are discarded
+CACHE_VERSION = 1
+
+# ID3 frames for the keys read by extract_metadata (the mapping EasyID3 would apply)
+_ID3_FRAMES = {
+    "title": "TIT2",
+    "artist": "TPE1",
+    "albumartist": "TPE2",
+    "album": "TALB",
+    "date": "TDRC",
+    "tracknumber": "TRCK",
+    "discnumber": "TPOS",
+    "genre": "TCON",
+    "composer": "TCOM",
+    "lyricist": "TEXT",
+    "language": "TLAN",
+    "copyright": "TCOP",
+    "organization": "TPUB",
+    "bpm": "TBPM",
+    "isrc": "TSRC",
+}
+
+# Fields whose values repeat across tracks of the same artist/album (track titles rarely do)
+SHARED_FIELDS = (
+    "album_artist", "artist", "album_name", "genre", "composer", "lyricist",
+    "publisher", "language", "copyright",
+)
+
+# Metadata keys embedded in the page, in column order
+EXPORT_KEYS = (
+    "file_path", "cover", "album_artist", "artist", "track_name", "album_name", "year",
+    "track_number", "disc_number", "genre", "composer", "lyricist", "language", "comment",
+    "copyright", "publisher", "bpm", "isrc", "rating", "length", "bitrate", "sample_rate",
+)
+
+# Cover art file names in order of preference (compared case-insensitively)
+COVER_NAMES = tuple(f"{name}{ext}" for ext in (".jpg", ".png", ".jpeg") for name in ("cover", "folder", "front", "album"))
+
+# Placeholder values for a file whose tags could not be read
+_ERROR_METADATA = {
+    "file_path": "",
+    "cover": None,
+    "album_artist": "Error",
+    "artist": "Error",
+    "track_name": "",
+    "album_name": "Error",
+    "year": 0,
+    "track_number": 0,
+    "disc_number": 0,
+    "genre": "",
+    "composer": "",
+    "lyricist": "",
+    "language": "",
+    "comment": "",
+    "copyright": "",
+    "publisher": "",
+    "bpm": 0,
+    "isrc": "",
+    "rating": 0,
+    "length": 0,
+    "bitrate": 0,
+    "sample_rate": 0,
+    "error": True  # Not exported; keeps the placeholder out of the metadata cache
+}
 
 # Extracts metadata from an audio file using Mutagen
 # @param {str} file_path - Path to the audio file
+# @param {str|None} cover - Path to the album cover (see _pick_cover)
+# @param {str|None} stem - File name without extension, used when there is no title tag
+# @param {str|None} ext - Lowercase file extension, used to pick the parser
 # @returns {dict|None} - Dictionary of metadata or None if failed
-def extract_metadata(file_path):
+def extract_metadata(file_path, cover, stem=None, ext=None):
+    if stem is None or ext is None:
+        stem, ext = os.path.splitext(os.path.basename(file_path))
+        ext = ext.lower()
     try:
-        # Easy=True attempts to map generic keys (artist, title, etc.) across formats
-        audio = mutagen.File(file_path, easy=True)
+        audio = _open_audio(file_path, ext)
         if audio is None:
             return None
-
-        # Helper to safely get the first item of a list tag
-        def get_tag(key, default=""):
-            val = audio.get(key, [default])
-            return str(val[0]) if val else default
-
-        # Helper to get numeric values safely
-        def get_num(key, default=0):
-            val = audio.get(key, [default])
-            try:
-                v = str(val[0])
-                if "/" in v:
-                    v = v.split("/")[0]
-                return int(v)
-            except:
-                return default
+        tags = _tag_view(audio)
+        info = getattr(audio, "info", None)
+        title = tags.get("title")
 
         # Metadata extraction
         metadata = {
             "file_path": file_path,
-            "cover": find_cover_image(file_path),
-            "album_artist": get_tag("albumartist", get_tag("artist", "Unknown Album Artist")),
-            "artist": get_tag("artist", "Unknown Artist"),
-            "track_name": get_tag("title", os.path.splitext(os.path.basename(file_path))[0]),
-            "album_name": get_tag("album", "Unknown Album"),
-            "year": get_num("date", 0),
-            "track_number": get_num("tracknumber", 0),
-            "disc_number": get_num("discnumber", 1),
-            "genre": get_tag("genre", ""),
-            "composer": get_tag("composer", ""),
-            "lyricist": get_tag("lyricist", ""),
-            "language": get_tag("language", ""),
-            "comment": get_tag("comment", ""),
-            "copyright": get_tag("copyright", ""),
-            "publisher": get_tag("organization", ""), 
-            "bpm": get_num("bpm", 0),
-            "isrc": get_tag("isrc", ""),
-            "length": audio.info.length if hasattr(audio, 'info') else 0,
-            "bitrate": int(audio.info.bitrate / 1000) if hasattr(audio, 'info') and hasattr(audio.info, 'bitrate') else 0,
-            "sample_rate": audio.info.sample_rate if hasattr(audio, 'info') and hasattr(audio.info, 'sample_rate') else 0,
-            "rating": get_num("rating", 0)
+            "cover": cover,
+            "album_artist": _get_tag(tags, "albumartist", _get_tag(tags, "artist", "Unknown Album Artist")),
+            "artist": _get_tag(tags, "artist", "Unknown Artist"),
+            "track_name": str(title[0]) if title else stem,
+            "album_name": _get_tag(tags, "album", "Unknown Album"),
+            "year": _get_num(tags, "date", 0),
+            "track_number": _get_num(tags, "tracknumber", 0),
+            "disc_number": _get_num(tags, "discnumber", 1),
+            "genre": _get_tag(tags, "genre", ""),
+            "composer": _get_tag(tags, "composer", ""),
+            "lyricist": _get_tag(tags, "lyricist", ""),
+            "language": _get_tag(tags, "language", ""),
+            "comment": _get_tag(tags, "comment", ""),
+            "copyright": _get_tag(tags, "copyright", ""),
+            "publisher": _get_tag(tags, "organization", ""), 
+            "bpm": _get_num(tags, "bpm", 0),
+            "isrc": _get_tag(tags, "isrc", ""),
+            "length": getattr(info, "length", 0),
+            "bitrate": int(getattr(info, "bitrate", 0) / 1000),
+            "sample_rate": getattr(info, "sample_rate", 0),
+            "rating": _get_num(tags, "rating", 0)
         }
         
         return metadata
     except Exception as e:
-        print(f"Error processing {file_path}: {e}")
-        return {
-            "file_path": file_path,
-            "cover": find_cover_image(file_path),
-            "album_artist": "Error",
-            "artist": "Error",
-            "track_name": os.path.splitext(os.path.basename(file_path))[0],
-            "album_name": "Error",
-            "year": 0,
-            "track_number": 0,
-            "disc_number": 0,
-            "genre": "",
-            "composer": "",
-            "lyricist": "",
-            "language": "",
-            "comment": "",
-            "copyright": "",
-            "publisher": "",
-            "bpm": 0,
-            "isrc": "",
-            "rating": 0,
-            "length": 0,
-            "bitrate": 0,
-            "sample_rate": 0
-        }
+        log.warning("Error processing %s: %s", file_path, e)
+        metadata = _ERROR_METADATA.copy()
+        metadata["file_path"] = file_path
+        metadata["cover"] = cover
+        metadata["track_name"] = stem
+        return metadata
+
+# Safely gets the first item of a list tag
+# @param {dict} tags - Tag key -> list of values (see _tag_view)
+# @param {str} key 
+# @param {str} default 
+# @returns {str}
+def _get_tag(tags, key, default=""):
+    val = tags.get(key)
+    return str(val[0]) if val else default
+
+# Gets numeric values safely ("3/12" and "2001-05-03" style values keep the first number)
+# @param {dict} tags - Tag key -> list of values (see _tag_view)
+# @param {str} key
+# @param {int} default
+# @returns {int}
+def _get_num(tags, key, default=0):
+    val = tags.get(key)
+    if not val:
+        return default
+    v = str(val[0]).partition("/")[0].partition("-")[0].strip()
+    return int(v) if v.isdecimal() else default
+
+# Opens an audio file with the parser matching its extension
+# Falls back to Mutagen's header sniffing for other extensions or mislabelled files
+# @param {str} file_path 
+# @param {str} ext - Lowercase file extension
+# @returns {mutagen.FileType|None}
+def _open_audio(file_path, ext):
+    parser = _PARSERS.get(ext)
+    if parser is not None:
+        try:
+            return parser(file_path)
+        except mutagen.MutagenError:
+            pass
+    # Easy=True attempts to map generic keys (artist, title, etc.) across formats
+    return mutagen.File(file_path, easy=True)
+
+# Returns a mapping of generic tag keys (artist, title, etc.) to lists of values
+# ID3 frames are read directly instead of going through EasyID3's per-key translation
+# @param {mutagen.FileType} audio 
+# @returns {dict|mutagen.FileType}
+def _tag_view(audio):
+    tags = audio.tags
+    if not isinstance(tags, ID3):
+        return audio
+    view = {}
+    for key, frame_id in _ID3_FRAMES.items():
+        frame = tags.get(frame_id)
+        if frame is not None:
+            # TCON may hold numeric ID3v1 genre references; .genres resolves them to names
+            view[key] = frame.genres if frame_id == "TCON" else frame.text
+    return view
 
 # Formats seconds into MM:SS or HH:MM:SS
 # @param {float} seconds 
 # @returns {str}
 def format_length(seconds):
     if not seconds: return "0:00"
-    hours = int(seconds // 3600)
-    minutes = int((seconds % 3600) // 60)
-    sec = int(seconds % 60)
+    minutes, sec = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
     if hours > 0:
         return f"{hours}:{minutes:02}:{sec:02}"
     else:
         return f"{minutes}:{sec:02}"
 
-# Looks for cover art in the file's folder
-# @param {str} file_path 
+# Picks the cover art out of an already listed folder
+# @param {str} folder 
+# @param {dict} file_names - Lowercased file name -> actual file name
 # @returns {str|None}
-def find_cover_image(file_path):
-    folder = os.path.dirname(file_path)
-
-    for ext in [".jpg", ".png", ".jpeg"]:
-        for name in ["cover", "folder", "front", "album"]:
-            cover_path = os.path.join(folder, f"{name}{ext}")
-            if os.path.isfile(cover_path):
-                return os.path.abspath(cover_path)
+def _pick_cover(folder, file_names):
+    for name in COVER_NAMES:
+        actual = file_names.get(name)
+        if actual:
+            return os.path.abspath(os.path.join(folder, actual))
     return None
 
+# Walks folder_path with os.scandir, listing every directory exactly once
+# The cover is picked from that listing, so no extra stat() calls are made per track
+# Folders are visited in the same top-down order as os.walk, which is the table's initial order
+# @param {str} folder_path 
+# @returns {iterator} - (os.DirEntry, stem, ext, cover) for every audio file
+def _walk_audio(folder_path):
+    stack = [folder_path]
+    while stack:
+        folder = stack.pop()
+        try:
+            with os.scandir(folder) as it:
+                entries = list(it)
+        except OSError:
+            continue
+
+        file_names = {}
+        audio_entries = []
+        subdirs = []
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                subdirs.append(entry.path)
+            elif entry.is_file():
+                name = entry.name
+                file_names[name.lower()] = name
+                dot = name.rfind('.')
+                if dot > 0:
+                    # Extensions are nearly always lowercase already, so only lower() on a miss
+                    ext = name[dot:]
+                    if ext in AUDIO_EXTS or (ext := ext.lower()) in AUDIO_EXTS:
+                        audio_entries.append((entry, name[:dot], ext))
+
+        # Reversed so the stack pops subfolders in listing order
+        stack.extend(reversed(subdirs))
+
+        if audio_entries:
+            cover = _pick_cover(folder, file_names)
+            for entry, stem, ext in audio_entries:
+                yield entry, stem, ext, cover
+
+# Opens the metadata cache, creating the table on first use
+# A cache written for another CACHE_VERSION is emptied, since its rows may be missing newer fixes
+# @param {str} cache_path 
+# @returns {sqlite3.Connection}
+def open_cache(cache_path):
+    conn = sqlite3.connect(cache_path)
+    if conn.execute("PRAGMA user_version").fetchone()[0] != CACHE_VERSION:
+        with conn:
+            conn.execute("DROP TABLE IF EXISTS metadata")
+            conn.execute(f"PRAGMA user_version = {CACHE_VERSION}")
+    conn.execute("CREATE TABLE IF NOT EXISTS metadata (path TEXT PRIMARY KEY, mtime REAL, size INTEGER, data TEXT)")
+    return conn
+
+# Runs extract_metadata over the files, in a pool of workers unless workers is 1
+# Threads suit network shares, where most time is spent waiting on I/O rather than parsing
+# @param {list} paths 
+# @param {list} covers 
+# @param {list} stems 
+# @param {list} exts 
+# @param {int|None} workers 
+# @param {bool} threads - Use a thread pool instead of a process pool
+# @returns {list} - One result (dict or None) per path
+def _extract_all(paths, covers, stems, exts, workers, threads=False):
+    if workers == 1 or len(paths) < 2:
+        return list(_progress(map(extract_metadata, paths, covers, stems, exts), len(paths)))
+
+    if threads:
+        executor = ThreadPoolExecutor(max_workers=workers or min(32, (os.cpu_count() or 1) * 4))
+    else:
+        executor = ProcessPoolExecutor(max_workers=workers)
+    with executor:
+        return list(_progress(executor.map(extract_metadata, paths, covers, stems, exts, chunksize=32), len(paths)))
+
+# Wraps an iterator in a tqdm progress bar when tqdm is installed
+# @param {iterator} results 
+# @param {int} total 
+# @returns {iterator}
+def _progress(results, total):
+    if tqdm is None:
+        return results
+    return tqdm(results, total=total, unit="file")
+
 # Scans folder recursively for audio files
+# Metadata is read in a pool of worker processes so disk seeks and mutagen parsing overlap
 # @param {str} folder_path 
+# @param {int|None} workers - Number of workers (None = one process per CPU, 1 = no pool)
+# @param {sqlite3.Connection|None} cache - Metadata cache from open_cache, None to always parse
+# @param {bool} threads - Read metadata in threads instead of processes
 # @returns {list}
-def collect_metadata(folder_path):
+def collect_metadata(folder_path, workers=None, cache=None, threads=False):
     metadata_list = []
-    audio_exts = {'.mp3', '.flac', '.m4a', '.ogg', '.wav', '.wma', '.aac', '.alac', '.aiff'}
-    
-    for root, _, files in os.walk(folder_path):
-        for file in files:
-            _, ext = os.path.splitext(file)
-            if ext.lower() in audio_exts:
-                file_path = os.path.join(root, file)
-                metadata = extract_metadata(file_path)
-                if metadata:
-                    metadata_list.append(metadata)
+    indexes, paths, covers, stems, exts, stats = [], [], [], [], [], []
+    for entry, stem, ext, cover in _walk_audio(folder_path):
+        if cache is not None:
+            st = entry.stat()
+            row = cache.execute("SELECT mtime, size, data FROM metadata WHERE path = ?", (entry.path,)).fetchone()
+            if row and row[0] == st.st_mtime and row[1] == st.st_size:
+                metadata = json.loads(row[2])
+                metadata["cover"] = cover
+                metadata_list.append(metadata)
+                continue
+            stats.append((st.st_mtime, st.st_size))
+
+        # Reserve the slot so the list keeps the walk order
+        indexes.append(len(metadata_list))
+        metadata_list.append(None)
+        paths.append(entry.path)
+        covers.append(cover)
+        stems.append(stem)
+        exts.append(ext)
+
+    results = _extract_all(paths, covers, stems, exts, workers, threads)
+    for index, metadata in zip(indexes, results):
+        metadata_list[index] = metadata
+
+    if cache is not None:
+        with cache:
+            cache.executemany(
+                "INSERT OR REPLACE INTO metadata (path, mtime, size, data) VALUES (?, ?, ?, ?)",
+                [(path, mtime, size, json.dumps(metadata))
+                 for path, (mtime, size), metadata in zip(paths, stats, results)
+                 # Read failures are often transient (locked file, network hiccup), so retry them next run
+                 if metadata and not metadata.get("error")]
+            )
+
+    metadata_list = [m for m in metadata_list if m]
+    _share_strings(metadata_list, SHARED_FIELDS)
     return metadata_list
 
-# Generates the HTML content with embedded JSON data and JS logic
+# Makes equal values of the given fields point at one string object
+# Each worker result arrives as its own copy, so without this every track keeps a duplicate
 # @param {list} metadata_list 
-# @returns {str}
-def generate_html(metadata_list):
+# @param {tuple} keys 
+def _share_strings(metadata_list, keys):
+    pool = {}
     for m in metadata_list:
-        m['length_display'] = format_length(m['length'])
-
-    # ensure_ascii=False writes actual unicode characters to the source code
-    json_data = json.dumps(metadata_list, ensure_ascii=False)
+        for key in keys:
+            value = m[key]
+            m[key] = pool.setdefault(value, value)
 
-    html_template = """<!DOCTYPE html>
+# Page template; {json_data} marks where the metadata JSON is embedded
+HTML_TEMPLATE = """<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>Audio Library</title>
     <style>
-        :root {{
+        :root {
             --bg-color: #121212;
             --surface-color: #1e1e1e;
             --primary-color: #bb86fc;
@@ -153,24 +401,24 @@ def generate_html(metadata_list):
             --input-bg: #2d2d2d;
             --success-color: #03dac6;
             --danger-color: #cf6679;
-        }}
-        body {{ 
+        }
+        body { 
             font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif; 
             margin: 0; 
             padding: 20px; 
             background-color: var(--bg-color); 
             color: var(--text-color); 
             overflow-x: hidden;
-        }}
+        }
         
-        .controls {{
+        .controls {
             display: flex;
             justify-content: space-between;
             align-items: center;
             margin-bottom: 20px;
-        }}
-        .controls-right {{ display: flex; gap: 10px; align-items: center; }}
-        button {{
+        }
+        .controls-right { display: flex; gap: 10px; align-items: center; }
+        button {
             background-color: var(--surface-color);
             color: var(--text-color);
             border: 1px solid var(--border-color);
@@ -178,59 +426,71 @@ def generate_html(metadata_list):
             cursor: pointer;
             border-radius: 4px;
             font-size: 14px;
-        }}
-        button:hover {{ background-color: var(--hover-color); }}
-        button.primary {{ background-color: var(--primary-color); color: #000; border: none; font-weight: bold; }}
-        button.danger {{ background-color: var(--danger-color); color: #000; border: none; }}
-        button.small {{ padding: 4px 8px; font-size: 12px; }}
+        }
+        button:hover { background-color: var(--hover-color); }
+        button.primary { background-color: var(--primary-color); color: #000; border: none; font-weight: bold; }
+        button.danger { background-color: var(--danger-color); color: #000; border: none; }
+        button.small { padding: 4px 8px; font-size: 12px; }
         
         /* Table */
-        .table-container {{ overflow-x: auto; min-height: 400px; padding-bottom: 50px; }}
-        table {{ 
+        .table-container { overflow: auto; height: calc(100vh - 110px); min-height: 400px; }
+        table { 
             border-collapse: collapse; 
             width: 100%; 
             min-width: 800px;
-        }}
-        th, td {{ 
+        }
+        th, td { 
             border: 1px solid var(--border-color); 
             padding: 8px; 
             text-align: left; 
             font-size: 14px;
-        }}
-        th {{ 
+        }
+        th { 
             background-color: #2c2c2c; 
             cursor: pointer; 
             user-select: none;
             white-space: nowrap;
-        }}
-        th:hover {{ background-color: var(--hover-color); }}
+            position: sticky;
+            top: 0;
+            z-index: 1;
+        }
+        /* Rows are virtualized, so every row has the same height: tall enough for a cover, text kept on one line */
+        tbody td {
+            height: 50px;
+            max-width: 300px;
+            white-space: nowrap;
+            overflow: hidden;
+            text-overflow: ellipsis;
+        }
+        th:hover { background-color: var(--hover-color); }
         
-        .sort-icon {{ margin-left: 5px; opacity: 0.5; font-size: 12px; }}
-        th.asc .sort-icon::after {{ content: '▲'; opacity: 1; color: var(--primary-color); }}
-        th.desc .sort-icon::after {{ content: '▼'; opacity: 1; color: var(--primary-color); }}
+        .sort-icon { margin-left: 5px; opacity: 0.5; font-size: 12px; }
+        th.asc .sort-icon::after { content: '▲'; opacity: 1; color: var(--primary-color); }
+        th.desc .sort-icon::after { content: '▼'; opacity: 1; color: var(--primary-color); }
         
-        .filter-trigger {{
+        .filter-trigger {
             margin-right: 8px;
             cursor: pointer;
             opacity: 0.4;
             font-size: 14px;
             display: inline-block;
-        }}
-        .filter-trigger:hover {{ opacity: 1; }}
-        .filter-trigger.active {{ opacity: 1; color: var(--primary-color); font-weight: bold; }}
+        }
+        .filter-trigger:hover { opacity: 1; }
+        .filter-trigger.active { opacity: 1; color: var(--primary-color); font-weight: bold; }
 
-        tr:nth-child(even) {{ background-color: var(--surface-color); }}
-        tr:hover {{ background-color: var(--hover-color); }}
+        tr.alt { background-color: var(--surface-color); }
+        tr:hover { background-color: var(--hover-color); }
+        tr.spacer, tr.spacer:hover { background-color: transparent; }
         
-        td img {{ 
+        td img { 
             width: 50px; 
             height: 50px; 
             object-fit: cover; 
             border-radius: 4px;
-        }}
+        }
 
         /* Common Modal/Popup Styles */
-        .modal {{
+        .modal {
             display: none;
             position: fixed;
             top: 0; left: 0; width: 100%; height: 100%;
@@ -238,9 +498,9 @@ def generate_html(metadata_list):
             z-index: 1000;
             justify-content: center;
             align-items: center;
-        }}
-        .modal.active {{ display: flex; }}
-        .modal-content {{
+        }
+        .modal.active { display: flex; }
+        .modal-content {
             background: var(--surface-color);
             padding: 20px;
             border-radius: 8px;
@@ -250,13 +510,13 @@ def generate_html(metadata_list):
             display: flex;
             flex-direction: column;
             border: 1px solid var(--border-color);
-        }}
-        .modal-header {{ font-size: 18px; font-weight: bold; margin-bottom: 15px; display: flex; justify-content: space-between; }}
-        .modal-body {{ overflow-y: auto; flex-grow: 1; margin-bottom: 15px; }}
-        .modal-footer {{ text-align: right; display: flex; justify-content: flex-end; gap: 10px; }}
+        }
+        .modal-header { font-size: 18px; font-weight: bold; margin-bottom: 15px; display: flex; justify-content: space-between; }
+        .modal-body { overflow-y: auto; flex-grow: 1; margin-bottom: 15px; }
+        .modal-footer { text-align: right; display: flex; justify-content: flex-end; gap: 10px; }
 
         /* Filter Popup */
-        .filter-popup {{
+        .filter-popup {
             display: none;
             position: absolute;
             background-color: var(--surface-color);
@@ -268,47 +528,47 @@ def generate_html(metadata_list):
             min-width: 300px;
             max-width: 90vw;
             box-sizing: border-box;
-        }}
-        .filter-popup.show {{ display: block; }}
-        .filter-list {{ 
+        }
+        .filter-popup.show { display: block; }
+        .filter-list { 
             margin-bottom: 10px; max-height: 150px; overflow-y: auto; 
             border-bottom: 1px solid var(--border-color); padding-bottom: 5px;
-        }}
-        .filter-chip {{
+        }
+        .filter-chip {
             display: inline-flex; align-items: center;
             background: var(--bg-color); border: 1px solid var(--border-color);
             padding: 4px 8px; margin: 0 4px 4px 0; border-radius: 12px; font-size: 11px;
             max-width: 100%; box-sizing: border-box;
-        }}
-        .filter-chip span {{ overflow: hidden; text-overflow: ellipsis; white-space: nowrap; }}
-        .filter-chip button {{
+        }
+        .filter-chip span { overflow: hidden; text-overflow: ellipsis; white-space: nowrap; }
+        .filter-chip button {
             background: none; border: none; color: var(--danger-color);
             font-weight: bold; margin-left: 5px; padding: 0; cursor: pointer; flex-shrink: 0;
-        }}
-        .filter-row {{ display: flex; gap: 5px; margin-bottom: 5px; flex-wrap: wrap; }}
-        .filter-options {{ display: flex; gap: 10px; margin: 8px 0; font-size: 12px; color: #ccc; flex-wrap: wrap; }}
+        }
+        .filter-row { display: flex; gap: 5px; margin-bottom: 5px; flex-wrap: wrap; }
+        .filter-options { display: flex; gap: 10px; margin: 8px 0; font-size: 12px; color: #ccc; flex-wrap: wrap; }
         
-        input, select, textarea {{
+        input, select, textarea {
             background: var(--input-bg); border: 1px solid var(--border-color);
             color: #fff; padding: 6px; border-radius: 3px; font-family: inherit;
-        }}
-        textarea {{ width: 100%; box-sizing: border-box; min-height: 100px; resize: vertical; }}
+        }
+        textarea { width: 100%; box-sizing: border-box; min-height: 100px; resize: vertical; }
 
         /* Column List (Customize & Export) */
-        .column-list {{
+        .column-list {
             border: 1px solid var(--border-color); padding: 5px; background: var(--bg-color);
             max-height: 300px; overflow-y: auto;
-        }}
-        .column-item {{
+        }
+        .column-item {
             display: flex; align-items: center; padding: 8px;
             border-bottom: 1px solid #333; background: var(--surface-color);
             user-select: none; margin-bottom: 2px;
-        }}
-        .column-item:hover {{ background-color: var(--hover-color); }}
-        .column-item label {{ flex-grow: 1; margin-left: 10px; cursor: pointer; }}
+        }
+        .column-item:hover { background-color: var(--hover-color); }
+        .column-item label { flex-grow: 1; margin-left: 10px; cursor: pointer; }
         
-        .export-options, .import-options {{ margin-bottom: 15px; display: flex; flex-direction: column; gap: 10px; }}
-        .row {{ display: flex; gap: 10px; align-items: center; }}
+        .export-options, .import-options { margin-bottom: 15px; display: flex; flex-direction: column; gap: 10px; }
+        .row { display: flex; gap: 10px; align-items: center; }
         
     </style>
 </head>
@@ -323,7 +583,7 @@ def generate_html(metadata_list):
         </div>
     </div>
 
-    <div class="table-container">
+    <div class="table-container" id="table-container">
         <table id="audio-table">
             <thead><!-- JS --></thead>
             <tbody><!-- JS --></tbody>
@@ -455,175 +715,312 @@ def generate_html(metadata_list):
 
     <script>
         // Use let so we can overwrite on Import
-        let audioData = {json_data};
+        let audioData = [];
+        // Always resolves: if the data can't be loaded the page still works (e.g. for Import) with an empty table
+        const dataReady = unpackData('{json_data}')
+            .then(columnData => { audioData = fromColumns(columnData); })
+            .catch(err => {
+                console.error(err);
+                alert('Could not load the library data. This page needs a browser with DecompressionStream support.\\n\\n' + err);
+            });
+
+        // The metadata is embedded as gzipped, base64-encoded JSON; inflate it with the browser's native gzip
+        async function unpackData(packed) {
+            const binary = atob(packed);
+            const bytes = new Uint8Array(binary.length);
+            for (let i = 0; i < binary.length; i++) bytes[i] = binary.charCodeAt(i);
+            const stream = new Blob([bytes]).stream().pipeThrough(new DecompressionStream('gzip'));
+            return new Response(stream).json();
+        }
+
+        // The metadata is embedded as one array per key so key names aren't repeated for every track;
+        // this rebuilds one object per track
+        function fromColumns(columnData) {
+            const keys = Object.keys(columnData);
+            const count = keys.length ? columnData[keys[0]].length : 0;
+            const rows = new Array(count);
+            for (let i = 0; i < count; i++) {
+                const row = {};
+                for (const key of keys) row[key] = columnData[key][i];
+                rows[i] = row;
+            }
+            return rows;
+        }
 
         // Config
         let columns = [
-            {{ key: 'cover', label: 'Cover Art', visible: true, type: 'image' }},
-            {{ key: 'track_name', label: 'Title', visible: true, type: 'text' }},
-            {{ key: 'artist', label: 'Artist', visible: true, type: 'text' }},
-            {{ key: 'album_artist', label: 'Album Artist', visible: true, type: 'text' }},
-            {{ key: 'album_name', label: 'Album', visible: true, type: 'text' }},
-            {{ key: 'year', label: 'Year', visible: true, type: 'number' }},
-            {{ key: 'disc_number', label: 'Disc #', visible: true, type: 'number' }},
-            {{ key: 'track_number', label: 'Track #', visible: true, type: 'number' }},
-            {{ key: 'genre', label: 'Genre', visible: true, type: 'text' }},
-            {{ key: 'composer', label: 'Composer', visible: true, type: 'text' }},
-            {{ key: 'lyricist', label: 'Lyricist', visible: true, type: 'text' }},
-            {{ key: 'publisher', label: 'Publisher', visible: true, type: 'text' }},
-            {{ key: 'language', label: 'Language', visible: true, type: 'text' }},
-            {{ key: 'comment', label: 'Comment', visible: true, type: 'text' }},
-            {{ key: 'rating', label: 'Rating', visible: true, type: 'number' }},
-            {{ key: 'length', label: 'Length', visible: false, type: 'duration' }},
-            {{ key: 'bpm', label: 'BPM', visible: false, type: 'number' }},
-            {{ key: 'bitrate', label: 'Bitrate (kbps)', visible: false, type: 'number' }},
-            {{ key: 'sample_rate', label: 'Sample Rate (Hz)', visible: false, type: 'number' }},
-            {{ key: 'copyright', label: 'Copyright', visible: false, type: 'text' }},
-            {{ key: 'isrc', label: 'ISRC', visible: false, type: 'text' }},
+            { key: 'cover', label: 'Cover Art', visible: true, type: 'image' },
+            { key: 'track_name', label: 'Title', visible: true, type: 'text' },
+            { key: 'artist', label: 'Artist', visible: true, type: 'text' },
+            { key: 'album_artist', label: 'Album Artist', visible: true, type: 'text' },
+            { key: 'album_name', label: 'Album', visible: true, type: 'text' },
+            { key: 'year', label: 'Year', visible: true, type: 'number' },
+            { key: 'disc_number', label: 'Disc #', visible: true, type: 'number' },
+            { key: 'track_number', label: 'Track #', visible: true, type: 'number' },
+            { key: 'genre', label: 'Genre', visible: true, type: 'text' },
+            { key: 'composer', label: 'Composer', visible: true, type: 'text' },
+            { key: 'lyricist', label: 'Lyricist', visible: true, type: 'text' },
+            { key: 'publisher', label: 'Publisher', visible: true, type: 'text' },
+            { key: 'language', label: 'Language', visible: true, type: 'text' },
+            { key: 'comment', label: 'Comment', visible: true, type: 'text' },
+            { key: 'rating', label: 'Rating', visible: true, type: 'number' },
+            { key: 'length', label: 'Length', visible: false, type: 'duration' },
+            { key: 'bpm', label: 'BPM', visible: false, type: 'number' },
+            { key: 'bitrate', label: 'Bitrate (kbps)', visible: false, type: 'number' },
+            { key: 'sample_rate', label: 'Sample Rate (Hz)', visible: false, type: 'number' },
+            { key: 'copyright', label: 'Copyright', visible: false, type: 'text' },
+            { key: 'isrc', label: 'ISRC', visible: false, type: 'text' },
         ];
 
-        let currentSort = {{ key: null, asc: true }};
-        let activeFilters = {{}}; 
+        let columnsVersion = 0; // bumped whenever columns is replaced
+
+        let currentSort = { key: null, asc: true };
+        let activeFilters = {}; 
         let visibleData = [];
         let pendingFilters = []; 
         let activeFilterColumn = null;
 
         // DOM Elements
         const table = document.getElementById('audio-table');
+        const tableContainer = document.getElementById('table-container');
         const countDisplay = document.getElementById('count-display');
         const filterPopup = document.getElementById('filter-popup');
+        const filterVal1 = document.getElementById('filter-val1');
+        const filterVal2 = document.getElementById('filter-val2');
 
-        document.addEventListener('DOMContentLoaded', () => {{
-            processData();
+        document.addEventListener('DOMContentLoaded', async () => {
             setupCustomizeModal();
             setupFilterUI();
             setupExportModal();
             setupImportModal();
+            tableContainer.addEventListener('scroll', scheduleRows, { passive: true });
+            // The container's height follows the window (and zoom changes row heights), so resizing can expose rows too
+            window.addEventListener('resize', scheduleRows);
             
             // Global click to close popups
-            document.addEventListener('click', (e) => {{
-                if (filterPopup.classList.contains('show')) {{
-                    if (!filterPopup.contains(e.target) && !e.target.classList.contains('filter-trigger')) {{
+            document.addEventListener('click', (e) => {
+                if (filterPopup.classList.contains('show')) {
+                    if (!filterPopup.contains(e.target) && !e.target.classList.contains('filter-trigger')) {
                         filterPopup.classList.remove('show');
-                    }}
-                }}
-            }});
-        }});
+                    }
+                }
+            });
+
+            await dataReady;
+            processData();
+        });
 
         // --- Data Logic ---
-        function processData() {{
-            visibleData = audioData.filter(item => {{
-                for (let key in activeFilters) {{
-                    const rules = activeFilters[key];
-                    if (!rules || rules.length === 0) continue;
-                    let rawVal = item[key];
-                    const isNum = (
-                        key === 'year' || key === 'track_number' || key === 'disc_number' || 
-                        key === 'bpm' || key === 'bitrate' || key === 'sample_rate' || 
-                        key === 'rating' || key === 'length'
-                    );
-                    const numVal = isNum ? Number(rawVal) : 0;
-                    const strVal = String(rawVal || ""); 
-
-                    for (let rule of rules) {{
-                        if (!checkRule(rule, numVal, strVal, isNum)) return false;
-                    }}
-                }}
+        // Columns filtered by numeric comparison rather than text matching
+        const NUM_KEYS = new Set(['year', 'track_number', 'disc_number', 'bpm', 'bitrate', 'sample_rate', 'rating', 'length']);
+
+        function processData() {
+            // Resolve each filtered column once instead of per row
+            const filters = [];
+            for (let key in activeFilters) {
+                const rules = activeFilters[key];
+                if (!rules || rules.length === 0) continue;
+                rules.forEach(prepareRule);
+                const isNum = NUM_KEYS.has(key);
+                filters.push({ key, rules: isNum ? rules : fuseRules(rules), isNum });
+            }
+            visibleData = filters.length === 0 ? audioData.slice() : audioData.filter(item => {
+                for (const { key, rules, isNum } of filters) {
+                    if (!matchesColumn(item, key, rules, isNum)) return false;
+                }
                 return true;
-            }});
+            });
             sortData();
             renderTable();
-            countDisplay.textContent = `${{visibleData.length}} items`;
-        }}
-
-        function checkRule(rule, numVal, strVal, isNum) {{
-            if (isNum) {{
-                const f1 = parseFloat(rule.value);
-                const f2 = parseFloat(rule.value2);
-                if (isNaN(f1)) return true; 
-                switch (rule.operator) {{
+            countDisplay.textContent = `${visibleData.length} items`;
+        }
+
+        function matchesColumn(item, key, rules, isNum) {
+            const rawVal = item[key];
+            const numVal = isNum ? Number(rawVal) : 0;
+            const strVal = isNum ? '' : String(rawVal || "");
+
+            for (let rule of rules) {
+                if (!checkRule(rule, numVal, strVal, isNum)) return false;
+            }
+            return true;
+        }
+
+        // Runs processData once on the next frame, however many changes ask for it before then
+        let processPending = false;
+        function scheduleProcessData() {
+            if (processPending) return;
+            processPending = true;
+            requestAnimationFrame(() => { processPending = false; processData(); });
+        }
+
+        // Rules were only added to one column: every row they keep is already in visibleData, so filter
+        // that (already sorted) subset by the new rules instead of starting over from audioData
+        function narrowData(key, addedRules) {
+            addedRules.forEach(prepareRule);
+            const isNum = NUM_KEYS.has(key);
+            const rules = isNum ? addedRules : fuseRules(addedRules);
+            visibleData = visibleData.filter(item => matchesColumn(item, key, rules, isNum));
+            renderTable();
+            countDisplay.textContent = `${visibleData.length} items`;
+        }
+
+        // Parses numbers, lowercases the search text and compiles regexes once per rule
+        // so checkRule does no per-row setup. Rules are never edited after they are added.
+        function prepareRule(rule) {
+            if (rule._prepared) return;
+            rule._prepared = true;
+            rule._numF1 = parseFloat(rule.value);
+            rule._numF2 = parseFloat(rule.value2);
+            rule._search = rule.matchCase ? rule.value : rule.value.toLowerCase();
+            rule._compiled = null;
+            rule._invalid = false;
+            const flags = rule.matchCase ? '' : 'i';
+            if (rule.useRegex) {
+                let pattern = rule.value;
+                if (rule.wholeWord) pattern = '\\\\b' + pattern + '\\\\b';
+                if (rule.operator === 'eq') pattern = '^' + pattern + '$';
+                if (rule.operator === 'starts') pattern = '^' + pattern;
+                if (rule.operator === 'ends') pattern = pattern + '$';
+                try {
+                    rule._compiled = getRegex(pattern, flags);
+                } catch (e) { rule._invalid = true; }
+            } else if (rule.wholeWord) {
+                rule._compiled = getRegex('\\\\b' + escapeRegex(rule._search) + '\\\\b', flags);
+            }
+        }
+
+        // Rules on a column are AND'ed, so "doesn't contain a" + "doesn't contain b" is the same as
+        // "doesn't match a|b": those are merged into one regex so each cell is scanned once.
+        // User regexes are left alone since wrapping them could renumber backreferences.
+        function fuseRules(rules) {
+            const groups = {};
+            const result = [];
+            for (const rule of rules) {
+                if (rule.operator === 'not_contains' && !rule.useRegex) {
+                    const flags = rule.matchCase ? '' : 'i';
+                    (groups[flags] = groups[flags] || []).push(rule);
+                } else {
+                    result.push(rule);
+                }
+            }
+            for (const flags in groups) {
+                const group = groups[flags];
+                if (group.length === 1) { result.push(group[0]); continue; }
+                const pattern = group.map(rule => rule._compiled ? rule._compiled.source : escapeRegex(rule._search)).join('|');
+                result.push({ operator: 'not_contains', _prepared: true, _invalid: false, _compiled: getRegex(pattern, flags) });
+            }
+            return result;
+        }
+
+        function escapeRegex(str) {
+            return str.replace(/[.*+?^${}()|[\\]\\\\]/g, '\\\\$&');
+        }
+
+        // Compiled patterns shared between rules (e.g. the same filter re-added on another column).
+        // None use the g flag, so test() keeps no state and one RegExp can serve every rule.
+        const REGEX_CACHE_SIZE = 256;
+        const regexCache = new Map();
+        function getRegex(pattern, flags) {
+            const cacheKey = flags + '/' + pattern;
+            let re = regexCache.get(cacheKey);
+            if (re) {
+                // Move to the back so the least recently used pattern is evicted first
+                regexCache.delete(cacheKey);
+            } else {
+                re = new RegExp(pattern, flags);
+                if (regexCache.size >= REGEX_CACHE_SIZE) regexCache.delete(regexCache.keys().next().value);
+            }
+            regexCache.set(cacheKey, re);
+            return re;
+        }
+
+        function checkRule(rule, numVal, strVal, isNum) {
+            if (isNum) {
+                const f1 = rule._numF1;
+                const f2 = rule._numF2;
+                if (isNaN(f1)) return true;
+                switch (rule.operator) {
                     case 'gt': return numVal > f1;
                     case 'lt': return numVal < f1;
                     case 'eq': return numVal === f1;
                     case 'between': return numVal >= f1 && numVal <= f2;
                     default: return true;
-                }}
-            }} 
-            let target = strVal;
-            let search = rule.value;
-            if (rule.useRegex) {{
-                try {{
-                    let pattern = search;
-                    if (rule.wholeWord) pattern = '\\\\b' + pattern + '\\\\b';
-                    if (rule.operator === 'eq') pattern = '^' + pattern + '$';
-                    if (rule.operator === 'starts') pattern = '^' + pattern;
-                    if (rule.operator === 'ends') pattern = pattern + '$';
-                    const flags = rule.matchCase ? '' : 'i';
-                    const re = new RegExp(pattern, flags);
-                    const match = re.test(target);
-                    return rule.operator === 'not_contains' ? !match : match;
-                }} catch (e) {{ return false; }}
-            }} else {{
-                if (!rule.matchCase) {{ target = target.toLowerCase(); search = search.toLowerCase(); }}
-                if (rule.wholeWord) {{
-                    const esc = search.replace(/[.*+?^${{}}()|[\\]\\\\]/g, '\\\\$&');
-                    const flags = rule.matchCase ? '' : 'i';
-                    const re = new RegExp('\\\\b' + esc + '\\\\b', flags);
-                    const match = re.test(target);
-                    return rule.operator === 'not_contains' ? !match : match;
-                }}
-                switch (rule.operator) {{
-                    case 'contains': return target.includes(search);
-                    case 'not_contains': return !target.includes(search);
-                    case 'starts': return target.startsWith(search);
-                    case 'ends': return target.endsWith(search);
-                    case 'eq': return target === search;
-                    default: return true;
-                }}
-            }}
-        }}
+                }
+            }
+            // Invalid regexes match nothing
+            if (rule._invalid) return false;
+            if (rule._compiled) {
+                const match = rule._compiled.test(strVal);
+                return rule.operator === 'not_contains' ? !match : match;
+            }
+            const target = rule.matchCase ? strVal : strVal.toLowerCase();
+            const search = rule._search;
+            switch (rule.operator) {
+                case 'contains': return target.includes(search);
+                case 'not_contains': return !target.includes(search);
+                case 'starts': return target.startsWith(search);
+                case 'ends': return target.endsWith(search);
+                case 'eq': return target === search;
+                default: return true;
+            }
+        }
 
-        function sortData() {{
+        // Locale-aware text order: case/accent-insensitive, with "Track 2" before "Track 10"
+        const collator = new Intl.Collator(undefined, { numeric: true, sensitivity: 'base' });
+
+        function sortData() {
             if (!currentSort.key) return;
-            visibleData.sort((a, b) => {{
-                let valA = a[currentSort.key];
-                let valB = b[currentSort.key];
-                if (valA === null || valA === undefined) valA = '';
-                if (valB === null || valB === undefined) valB = '';
-                if (typeof valA === 'number' && typeof valB === 'number') {{
-                    return currentSort.asc ? valA - valB : valB - valA;
-                }}
-                valA = valA.toString().toLowerCase();
-                valB = valB.toString().toLowerCase();
-                if (valA < valB) return currentSort.asc ? -1 : 1;
-                if (valA > valB) return currentSort.asc ? 1 : -1;
-                return 0;
-            }});
-        }}
+            const key = currentSort.key;
+            const dir = currentSort.asc ? 1 : -1;
+            // Read each row's sort key once, then sort row indexes against that array
+            const count = visibleData.length;
+            const keys = new Array(count);
+            const order = new Array(count);
+            let allNumbers = true;
+            for (let i = 0; i < count; i++) {
+                let val = visibleData[i][key];
+                if (val === null || val === undefined) val = '';
+                if (typeof val !== 'number') { val = String(val); allNumbers = false; }
+                keys[i] = val;
+                order[i] = i;
+            }
+            if (allNumbers) {
+                order.sort((a, b) => (keys[a] - keys[b]) * dir);
+            } else {
+                order.sort((a, b) => {
+                    const valA = keys[a];
+                    const valB = keys[b];
+                    if (typeof valA === 'number' && typeof valB === 'number') return (valA - valB) * dir;
+                    return collator.compare(String(valA), String(valB)) * dir;
+                });
+            }
+            const sorted = new Array(count);
+            for (let i = 0; i < count; i++) sorted[i] = visibleData[order[i]];
+            visibleData = sorted;
+        }
 
         // --- Rendering ---
-        function renderTable() {{
+        function renderTable() {
             const thead = table.querySelector('thead');
-            const tbody = table.querySelector('tbody');
             thead.innerHTML = '';
-            tbody.innerHTML = '';
 
             const trHead = document.createElement('tr');
-            columns.forEach(col => {{
+            columns.forEach(col => {
                 if (!col.visible) return;
                 const th = document.createElement('th');
                 const div = document.createElement('div');
                 div.style.display = 'flex';
                 div.style.alignItems = 'center';
 
-                if (col.key !== 'cover') {{
+                if (col.key !== 'cover') {
                     const hasFilter = activeFilters[col.key] && activeFilters[col.key].length > 0;
                     const filterSpan = document.createElement('span');
                     filterSpan.className = 'filter-trigger ' + (hasFilter ? 'active' : '');
                     filterSpan.innerHTML = '&#x1F702;'; 
-                    filterSpan.onclick = (e) => {{ e.stopPropagation(); openFilterPopup(col, filterSpan); }};
+                    filterSpan.onclick = (e) => { e.stopPropagation(); openFilterPopup(col, filterSpan); };
                     div.appendChild(filterSpan);
-                }}
+                }
 
                 const labelSpan = document.createElement('span');
                 labelSpan.textContent = col.label;
@@ -635,79 +1032,161 @@ def generate_html(metadata_list):
                 th.onclick = () => handleSort(col.key);
                 if (currentSort.key === col.key) th.classList.add(currentSort.asc ? 'asc' : 'desc');
                 trHead.appendChild(th);
-            }});
+            });
             thead.appendChild(trHead);
 
-            const fragment = document.createDocumentFragment();
-            visibleData.forEach(item => {{
-                const tr = document.createElement('tr');
-                columns.forEach(col => {{
-                    if (!col.visible) return;
-                    const td = document.createElement('td');
-                    if (col.type === 'image') {{
-                        if (item[col.key]) {{
-                            const img = document.createElement('img');
-                            img.src = item[col.key]; img.loading = 'lazy'; td.appendChild(img);
-                        }}
-                    }} else if (col.type === 'duration') {{
-                        td.textContent = item['length_display'] || '0:00';
-                    }} else {{
-                        td.textContent = item[col.key] !== null ? item[col.key] : '';
-                    }}
-                    tr.appendChild(td);
-                }});
-                fragment.appendChild(tr);
-            }});
-            tbody.appendChild(fragment);
-        }}
-
-        function handleSort(key) {{
+            renderedStart = -1; // data or columns changed: the current window is stale
+            renderRows();
+        }
+
+        // Only the rows in (and just around) the scrolled viewport are in the DOM; spacer rows
+        // above and below stand in for the rest so the scrollbar still covers the whole list
+        const OVERSCAN = 10;
+        let rowHeight = 67; // 50px cell + 2 x 8px padding + 1px border; replaced by the measured height
+        let renderedStart = -1;
+        let renderedEnd = -1;
+        let rowsPending = false;
+
+        function renderRows() {
+            const tbody = table.querySelector('tbody');
+            const total = visibleData.length;
+            const scrollTop = tableContainer.scrollTop;
+            const start = Math.min(total, Math.max(0, Math.floor(scrollTop / rowHeight) - OVERSCAN));
+            const end = Math.min(total, Math.ceil((scrollTop + tableContainer.clientHeight) / rowHeight) + OVERSCAN);
+            // Small scrolls often land in the same window; leave the DOM alone then
+            if (start === renderedStart && end === renderedEnd) return;
+            renderedStart = start;
+            renderedEnd = end;
+
+            // Build every row as one HTML string so the browser parses the body once
+            const renderCells = getRowRenderer();
+            const parts = [];
+            if (start > 0) parts.push('<tr class="spacer" style="height:' + (start * rowHeight) + 'px"></tr>');
+            for (let i = start; i < end; i++) {
+                // Parity comes from the row's index since the spacer throws off :nth-child
+                parts.push((i % 2 ? '<tr class="alt">' : '<tr>') + renderCells(visibleData[i], escapeHtml) + '</tr>');
+            }
+            if (end < total) parts.push('<tr class="spacer" style="height:' + ((total - end) * rowHeight) + 'px"></tr>');
+            tbody.innerHTML = parts.join('');
+
+            // Measure a real row (zoom and font size change it) and redo the window if the estimate was off
+            const probe = start < end && tbody.rows ? tbody.rows[start > 0 ? 1 : 0] : null;
+            const measured = probe ? probe.getBoundingClientRect().height : 0;
+            if (measured > 0 && Math.abs(measured - rowHeight) > 0.5) {
+                rowHeight = measured;
+                renderedStart = -1;
+                scheduleRows();
+            }
+        }
+
+        // The cells of a row are built by a function generated for the visible columns, so rendering
+        // a row is straight-line code with no per-cell type checks. It is rebuilt when the columns change
+        let rowRenderer = null;
+        let rowRendererSig = '';
+
+        function getRowRenderer() {
+            const visibleCols = columns.filter(col => col.visible);
+            const sig = visibleCols.map(col => col.key + ':' + col.type).join(',');
+            if (rowRenderer && sig === rowRendererSig) return rowRenderer;
+
+            const body = visibleCols.map(col => {
+                const key = JSON.stringify(col.key);
+                if (col.type === 'image') {
+                    return `v=item[${key}];h+=v?'<td><img loading="lazy" src="'+esc(v)+'"></td>':'<td></td>';`;
+                }
+                if (col.type === 'duration') return `h+='<td>'+esc(item.length_display||'0:00')+'</td>';`;
+                // Cells are cut off with an ellipsis to keep rows one height; the title shows the full value on hover
+                return `v=item[${key}];if(v===null||v===undefined||v===''){h+='<td></td>';}` +
+                    `else{v=esc(String(v));h+='<td title="'+v+'">'+v+'</td>';}`;
+            }).join('');
+            rowRenderer = new Function('item', 'esc', "let h='',v;" + body + 'return h;');
+            rowRendererSig = sig;
+            return rowRenderer;
+        }
+
+        // Scroll events can fire several times per frame; re-render at most once per frame
+        function scheduleRows() {
+            if (rowsPending) return;
+            rowsPending = true;
+            requestAnimationFrame(() => { rowsPending = false; renderRows(); });
+        }
+
+        const HTML_ESCAPES = { '&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#39;' };
+        function escapeHtml(str) {
+            return str.replace(/[&<>"']/g, ch => HTML_ESCAPES[ch]);
+        }
+
+        function handleSort(key) {
             if (currentSort.key === key) currentSort.asc = !currentSort.asc;
-            else {{ currentSort.key = key; currentSort.asc = true; }}
-            processData();
-        }}
+            else { currentSort.key = key; currentSort.asc = true; }
+            scheduleProcessData();
+        }
 
         // --- Filter Logic ---
-        function setupFilterUI() {{
-            const valInput = document.getElementById('filter-val1');
-            const valInput2 = document.getElementById('filter-val2');
+        function setupFilterUI() {
+            const valInput = filterVal1;
+            const valInput2 = filterVal2;
 
-            const addRule = () => {{
+            const addRule = () => {
                 const op = document.getElementById('filter-op').value;
                 const v1 = valInput.value;
                 const v2 = valInput2.value;
                 if (v1.trim() === '') return;
-                const rule = {{ 
+                const rule = { 
                     operator: op, value: v1, value2: v2,
                     matchCase: document.getElementById('chk-case').checked,
                     wholeWord: document.getElementById('chk-word').checked,
                     useRegex: document.getElementById('chk-regex').checked
-                }};
+                };
+                prepareRule(rule);
                 pendingFilters.push(rule);
                 valInput.value = ''; valInput2.value = ''; valInput.focus();
                 renderPendingFilters();
-            }};
+            };
 
             document.getElementById('btn-add-filter').onclick = addRule;
-            valInput.addEventListener('keypress', (e) => {{ if (e.key === 'Enter') addRule(); }});
-            valInput2.addEventListener('keypress', (e) => {{ if (e.key === 'Enter') addRule(); }});
-
-            document.getElementById('btn-apply-filters').onclick = () => {{
-                if (activeFilterColumn) {{
-                    if (pendingFilters.length > 0) activeFilters[activeFilterColumn.key] = [...pendingFilters];
-                    else delete activeFilters[activeFilterColumn.key];
-                }}
+            valInput.addEventListener('keypress', (e) => { if (e.key === 'Enter') addRule(); });
+            valInput2.addEventListener('keypress', (e) => { if (e.key === 'Enter') addRule(); });
+
+            document.getElementById('btn-apply-filters').onclick = () => {
+                let added = null;
+                if (activeFilterColumn) {
+                    const key = activeFilterColumn.key;
+                    const previous = activeFilters[key] || [];
+                    // Rule objects are shared with pendingFilters, so identity tells whether any were removed
+                    if (pendingFilters.length > previous.length && previous.every(r => pendingFilters.includes(r))) {
+                        added = pendingFilters.filter(r => !previous.includes(r));
+                    }
+                    if (pendingFilters.length > 0) activeFilters[key] = [...pendingFilters];
+                    else delete activeFilters[key];
+                }
                 filterPopup.classList.remove('show');
-                processData();
-            }};
-            document.getElementById('btn-clear-column').onclick = () => {{ pendingFilters = []; renderPendingFilters(); }};
-            document.getElementById('btn-close-filter').onclick = () => {{ filterPopup.classList.remove('show'); }};
-            document.getElementById('filter-op').onchange = (e) => {{
+                // If a full pass is already queued (e.g. by a sort click), it will pick the new rules up
+                if (added && !processPending) narrowData(activeFilterColumn.key, added);
+                else scheduleProcessData();
+            };
+            document.getElementById('btn-clear-column').onclick = () => { pendingFilters = []; renderPendingFilters(); };
+            // One listener for every chip's remove button
+            document.getElementById('filter-list').addEventListener('click', (e) => {
+                const btn = e.target.closest('button[data-idx]');
+                if (!btn) return;
+                e.stopPropagation();
+                pendingFilters.splice(Number(btn.dataset.idx), 1);
+                renderPendingFilters();
+            });
+            document.getElementById('btn-close-filter').onclick = () => { filterPopup.classList.remove('show'); };
+            document.getElementById('filter-op').onchange = (e) => {
                 document.getElementById('row-val2').style.display = e.target.value === 'between' ? 'flex' : 'none';
-            }};
-        }}
+            };
+        }
+
+        function openFilterPopup(col, triggerEl) {
+            // Read layout before the DOM writes below so the browser only has to lay out once
+            const rect = triggerEl.getBoundingClientRect();
+            const scrollX = window.scrollX || window.pageXOffset;
+            const scrollY = window.scrollY || window.pageYOffset;
+            const viewportWidth = document.documentElement.clientWidth;
 
-        function openFilterPopup(col, triggerEl) {{
             activeFilterColumn = col;
             pendingFilters = activeFilters[col.key] ? [...activeFilters[col.key]] : [];
             const selOp = document.getElementById('filter-op');
@@ -715,324 +1194,528 @@ def generate_html(metadata_list):
             
             const isNum = (col.type === 'number' || col.type === 'duration');
             const ops = isNum 
-                ? [{{v:'eq',t:'Equals'}}, {{v:'gt',t:'Greater Than'}}, {{v:'lt',t:'Less Than'}}, {{v:'between',t:'Between'}}]
-                : [{{v:'contains',t:'Contains'}}, {{v:'not_contains',t:'Does not contain'}}, {{v:'starts',t:'Starts with'}}, {{v:'ends',t:'Ends with'}}, {{v:'eq',t:'Equals'}}];
-            ops.forEach(o => {{
+                ? [{v:'eq',t:'Equals'}, {v:'gt',t:'Greater Than'}, {v:'lt',t:'Less Than'}, {v:'between',t:'Between'}]
+                : [{v:'contains',t:'Contains'}, {v:'not_contains',t:'Does not contain'}, {v:'starts',t:'Starts with'}, {v:'ends',t:'Ends with'}, {v:'eq',t:'Equals'}];
+            ops.forEach(o => {
                 const opt = document.createElement('option'); opt.value = o.v; opt.textContent = o.t; selOp.appendChild(opt);
-            }});
+            });
             selOp.value = ops[0].v;
-            document.getElementById('filter-val1').value = '';
-            document.getElementById('filter-val2').value = '';
+            filterVal1.value = '';
+            filterVal2.value = '';
             document.getElementById('row-val2').style.display = 'none';
             document.getElementById('text-options').style.display = isNum ? 'none' : 'flex';
             document.getElementById('chk-case').checked = false;
             document.getElementById('chk-word').checked = false;
             document.getElementById('chk-regex').checked = false;
 
-            const input1 = document.getElementById('filter-val1');
-            input1.type = isNum ? 'number' : 'text';
-            document.getElementById('filter-val2').type = 'number';
+            filterVal1.type = isNum ? 'number' : 'text';
+            filterVal2.type = 'number';
             renderPendingFilters();
 
-            const rect = triggerEl.getBoundingClientRect();
-            const scrollX = window.scrollX || window.pageXOffset;
-            const scrollY = window.scrollY || window.pageYOffset;
-            const viewportWidth = document.documentElement.clientWidth;
             const popupWidth = 320; 
+            const top = rect.bottom + scrollY + 5;
             let left = rect.left + scrollX;
             if (left + popupWidth > viewportWidth) left = viewportWidth - popupWidth - 10;
             if (left < 10) left = 10;
 
-            filterPopup.style.top = (rect.bottom + scrollY + 5) + 'px';
-            filterPopup.style.left = left + 'px';
-            filterPopup.classList.add('show');
-            setTimeout(() => input1.focus(), 100);
-        }}
+            // Apply the position in one style write, together with showing the popup, at the next frame,
+            // and focus the input as soon as it is visible
+            requestAnimationFrame(() => {
+                filterPopup.style.cssText = `top:${top}px;left:${left}px;`;
+                filterPopup.classList.add('show');
+                filterVal1.focus();
+            });
+        }
 
-        function renderPendingFilters() {{
+        function renderPendingFilters() {
             const container = document.getElementById('filter-list');
-            container.innerHTML = '';
-            if (pendingFilters.length === 0) {{
+            if (pendingFilters.length === 0) {
                 container.innerHTML = '<div style="padding:10px; color:#777; font-size:12px; text-align:center">No active filters</div>';
                 return;
-            }}
-            pendingFilters.forEach((f, idx) => {{
-                const chip = document.createElement('div');
-                chip.className = 'filter-chip';
-                let text = `${{f.operator}} "${{f.value}}"`;
-                if (f.operator === 'between') text += ` - "${{f.value2}}"`;
+            }
+            container.innerHTML = pendingFilters.map((f, idx) => {
+                let text = `${f.operator} "${f.value}"`;
+                if (f.operator === 'between') text += ` - "${f.value2}"`;
                 if (f.matchCase) text += ' [Aa]';
                 if (f.wholeWord) text += ' [""]';
                 if (f.useRegex) text += ' [.*]';
-                const span = document.createElement('span'); span.textContent = text;
-                const btn = document.createElement('button'); btn.textContent = '✕';
-                btn.onclick = (e) => {{ e.stopPropagation(); pendingFilters.splice(idx, 1); renderPendingFilters(); }};
-                chip.appendChild(span); chip.appendChild(btn); container.appendChild(chip);
-            }});
-        }}
+                return `<div class="filter-chip"><span>${escapeHtml(text)}</span><button data-idx="${idx}">✕</button></div>`;
+            }).join('');
+        }
 
         // --- Export & Import ---
-        function setupExportModal() {{
+        function setupExportModal() {
             const modal = document.getElementById('modal-export');
             const list = document.getElementById('export-column-list');
             const formatSel = document.getElementById('export-format');
             const txtAreaDiv = document.getElementById('export-clipboard-area');
 
-            document.getElementById('btn-export').onclick = () => {{
+            document.getElementById('btn-export').onclick = () => {
                 // Populate columns
-                list.innerHTML = '';
-                columns.forEach(col => {{
-                    const div = document.createElement('div');
-                    div.className = 'column-item';
-                    const cb = document.createElement('input');
-                    cb.type = 'checkbox';
-                    cb.checked = col.visible; 
-                    cb.value = col.key;
-                    const lbl = document.createElement('label');
-                    lbl.textContent = col.label;
-                    lbl.onclick = () => cb.click();
-                    div.appendChild(cb); div.appendChild(lbl); list.appendChild(div);
-                }});
+                list.innerHTML = columns.map(col => {
+                    const key = escapeHtml(col.key);
+                    return `<div class="column-item"><input type="checkbox" id="export-col-${key}" value="${key}"${col.visible ? ' checked' : ''}>` +
+                        `<label for="export-col-${key}">${escapeHtml(col.label)}</label></div>`;
+                }).join('');
                 txtAreaDiv.style.display = 'none';
                 modal.classList.add('active');
-            }};
+            };
 
             document.getElementById('btn-close-export').onclick = () => modal.classList.remove('active');
 
-            document.getElementById('btn-export-select-all').onclick = () => {{
+            document.getElementById('btn-export-select-all').onclick = () => {
                 list.querySelectorAll('input[type="checkbox"]').forEach(c => c.checked = true);
-            }};
+            };
 
-            document.getElementById('btn-export-deselect-all').onclick = () => {{
+            document.getElementById('btn-export-deselect-all').onclick = () => {
                 list.querySelectorAll('input[type="checkbox"]').forEach(c => c.checked = false);
-            }};
+            };
 
-            document.getElementById('btn-perform-export').onclick = () => {{
+            document.getElementById('btn-perform-export').onclick = () => {
                 const format = formatSel.value;
-                let delimiter = document.getElementById('export-delimiter').value;
-                if (delimiter === '\\t') delimiter = '\\t';
+                const delimiter = readDelimiter('export-delimiter');
+                const escapeCell = makeEscaper(delimiter);
 
                 const selectedKeys = Array.from(list.querySelectorAll('input:checked')).map(cb => cb.value);
-                if (selectedKeys.length === 0) {{ alert("Select at least one column."); return; }}
+                if (selectedKeys.length === 0) { alert("Select at least one column."); return; }
 
                 // Header
-                const header = selectedKeys.map(k => {{
+                const header = selectedKeys.map(k => {
                     const c = columns.find(col => col.key === k);
-                    return escapeCSV(c.label, delimiter);
-                }}).join(delimiter);
-
-                // Rows
-                const rows = visibleData.map(item => {{
-                    return selectedKeys.map(k => {{
-                        let val = item[k];
-                        if (k === 'length') val = item['length_display'];
-                        return escapeCSV(String(val || ''), delimiter);
-                    }}).join(delimiter);
-                }}).join('\\n');
-
-                const content = header + '\\n' + rows;
-
-                if (format === 'clipboard') {{
+                    return escapeCell(c.label);
+                }).join(delimiter);
+
+                // Rows are collected in chunks of about 64K characters. For files each chunk is encoded
+                // to UTF-8 right away, so the export is held as compact bytes rather than UTF-16 strings
+                // and the Blob joins the chunks without building one huge string.
+                const toFile = format !== 'clipboard';
+                const encoder = new TextEncoder();
+                const parts = [];
+                let chunk = header;
+                // Length is exported as its display string; resolve that per column, not per cell
+                const cellKeys = selectedKeys.map(k => k === 'length' ? 'length_display' : k);
+                const keyCount = cellKeys.length;
+                const rowBuf = new Array(keyCount); // reused for every row
+                for (let i = 0; i < visibleData.length; i++) {
+                    const item = visibleData[i];
+                    for (let j = 0; j < keyCount; j++) {
+                        const val = item[cellKeys[j]];
+                        rowBuf[j] = escapeCell(typeof val === 'string' ? val : String(val || ''));
+                    }
+                    chunk += '\\n' + rowBuf.join(delimiter);
+                    if (chunk.length >= 65536) {
+                        parts.push(toFile ? encoder.encode(chunk) : chunk);
+                        chunk = '';
+                    }
+                }
+                parts.push(toFile ? encoder.encode(chunk) : chunk);
+
+                if (format === 'clipboard') {
+                    const content = parts.join('');
+                    // The text is always shown in the preview, whichever way it gets copied
                     const ta = document.getElementById('export-textarea');
                     ta.value = content;
                     txtAreaDiv.style.display = 'block';
                     ta.select();
-                    document.execCommand('copy'); 
-                }} else {{
+                    if (navigator.clipboard && navigator.clipboard.writeText) {
+                        // execCommand('copy') only works during the click itself, so once writeText is
+                        // refused all that's left is the selected preview for the user to copy
+                        navigator.clipboard.writeText(content).catch(() => {
+                            ta.select();
+                            alert("Couldn't copy to the clipboard automatically. The text is selected in the preview; press Ctrl+C (Cmd+C on Mac) to copy it.");
+                        });
+                    } else {
+                        // Older browsers: copy the selection while still handling the click
+                        document.execCommand('copy');
+                    }
+                } else {
                     // Add Byte Order Mark (BOM) for Excel to read UTF-8 correctly
                     const bom = new Uint8Array([0xEF, 0xBB, 0xBF]); 
-                    const blob = new Blob([bom, content], {{ type: 'text/csv;charset=utf-8' }});
+                    parts.unshift(bom);
+                    const blob = new Blob(parts, { type: 'text/csv;charset=utf-8' });
                     const url = URL.createObjectURL(blob);
                     const a = document.createElement('a');
                     a.href = url;
-                    a.download = `audio_library_export.${{format}}`;
+                    a.download = `audio_library_export.${format}`;
                     a.click();
                     URL.revokeObjectURL(url);
                     modal.classList.remove('active');
-                }}
-            }};
-        }}
-
-        function escapeCSV(str, delimiter) {{
-            if (str.includes(delimiter) || str.includes('"') || str.includes('\\n')) {{
-                return '"' + str.replace(/"/g, '""') + '"';
-            }}
-            return str;
-        }}
-
-        function setupImportModal() {{
+                }
+            };
+        }
+
+        // Builds the CSV escaper for one delimiter; its character-class regex finds values
+        // that need quoting in a single scan
+        function makeEscaper(delimiter) {
+            const re = new RegExp('["\\n' + escapeRegex(delimiter) + ']');
+            return (str) => re.test(str) ? '"' + str.replace(/"/g, '""') + '"' : str;
+        }
+
+        // The Tab option's value is the two characters \\t; turn it into an actual tab
+        function readDelimiter(id) {
+            const value = document.getElementById(id).value;
+            return value === '\\\\t' ? '\\t' : value;
+        }
+
+        function setupImportModal() {
             const modal = document.getElementById('modal-import');
             document.getElementById('btn-import').onclick = () => modal.classList.add('active');
             document.getElementById('btn-close-import').onclick = () => modal.classList.remove('active');
 
-            document.getElementById('btn-perform-import').onclick = () => {{
+            document.getElementById('btn-perform-import').onclick = () => {
                 const fileInput = document.getElementById('import-file');
                 const ta = document.getElementById('import-textarea');
-                let delimiter = document.getElementById('import-delimiter').value;
-                if (delimiter === '\\t') delimiter = '\\t';
-
-                if (fileInput.files.length > 0) {{
-                    const reader = new FileReader();
-                    reader.onload = (e) => parseImport(e.target.result, delimiter, modal);
-                    reader.readAsText(fileInput.files[0]);
-                }} else if (ta.value.trim() !== '') {{
+                const delimiter = readDelimiter('import-delimiter');
+
+                if (fileInput.files.length > 0) {
+                    // A read, decode or parse failure would otherwise be an unhandled rejection with no feedback
+                    importFile(fileInput.files[0], delimiter, modal).catch(err => {
+                        console.error(err);
+                        alert("Could not import the file: " + err);
+                    });
+                } else if (ta.value.trim() !== '') {
                     parseImport(ta.value, delimiter, modal);
-                }} else {{
+                } else {
                     alert("Please select a file or paste data.");
-                }}
-            }};
-        }}
+                }
+            };
+        }
 
-        function parseImport(text, delimiter, modal) {{
+        function parseImport(text, delimiter, modal) {
             const lines = text.trim().split('\\n');
-            if (lines.length < 2) {{ alert("Invalid data format."); return; }}
-
-            // Parse Header
-            const headers = splitCSV(lines[0], delimiter).map(h => h.trim());
-            const keyMap = {{}};
-            headers.forEach((h, idx) => {{
-                const col = columns.find(c => c.label.toLowerCase() === h.toLowerCase() || c.key.toLowerCase() === h.toLowerCase());
-                if (col) keyMap[idx] = col.key;
-            }});
+            if (lines.length < 2) { alert("Invalid data format."); return; }
 
+            const parseRow = createRowParser(lines[0], delimiter);
             const newData = [];
-            for (let i = 1; i < lines.length; i++) {{
+            for (let i = 1; i < lines.length; i++) {
                 if (!lines[i].trim()) continue;
-                const vals = splitCSV(lines[i], delimiter);
-                const obj = {{}};
-                columns.forEach(c => obj[c.key] = (c.type === 'number' ? 0 : ''));
-                
-                vals.forEach((v, idx) => {{
-                    if (keyMap[idx]) {{
-                        let val = v.trim();
-                        const col = columns.find(c => c.key === keyMap[idx]);
-                        if (col.type === 'number') val = Number(val) || 0;
-                        if (col.key === 'length') {{
-                            if (val.includes(':')) {{
-                                const parts = val.split(':').map(Number);
-                                if (parts.length === 2) val = parts[0]*60 + parts[1];
-                                if (parts.length === 3) val = parts[0]*3600 + parts[1]*60 + parts[2];
-                            }} else {{
-                                val = Number(val);
-                            }}
-                        }}
-                        obj[keyMap[idx]] = val;
-                    }}
-                }});
+                newData.push(parseRow(lines[i]));
+            }
+            finishImport(newData, modal);
+        }
+
+        // Decodes and parses the file chunk by chunk, so the whole file never has to be held as one string
+        async function importFile(file, delimiter, modal) {
+            const reader = file.stream().pipeThrough(new TextDecoderStream()).getReader();
+            const newData = [];
+            let parseRow = null;
+            let carry = '';
+            const handleLine = (line) => {
+                if (!line.trim()) return;
+                if (parseRow) newData.push(parseRow(line));
+                else parseRow = createRowParser(line, delimiter); // first non-blank line is the header
+            };
+            while (true) {
+                const { value, done } = await reader.read();
+                if (done) break;
+                const lines = (carry + value).split('\\n');
+                carry = lines.pop(); // may be the start of a line continued in the next chunk
+                lines.forEach(handleLine);
+            }
+            handleLine(carry);
+            if (newData.length === 0) { alert("Invalid data format."); return; }
+            finishImport(newData, modal);
+        }
+
+        // Maps the header's columns to table columns and returns a function turning one CSV line into a row object
+        function createRowParser(headerLine, delimiter) {
+            const headers = splitCSV(headerLine, delimiter).map(h => h.trim());
+            // Resolve every CSV column to its table column once; the row loop then only indexes arrays
+            const idxKey = new Array(headers.length).fill(null);
+            const idxType = new Array(headers.length).fill(null);
+            const byName = colNameIndex();
+            headers.forEach((h, idx) => {
+                const col = byName.get(h.toLowerCase());
+                if (col) { idxKey[idx] = col.key; idxType[idx] = col.type; }
+            });
+
+            // Default values for columns missing from the import; every row starts as a copy
+            const template = {};
+            columns.forEach(c => template[c.key] = (c.type === 'number' ? 0 : ''));
+
+            return (line) => {
+                const vals = splitCSV(line, delimiter);
+                const obj = { ...template };
+                const count = Math.min(vals.length, idxKey.length);
+
+                for (let j = 0; j < count; j++) {
+                    const key = idxKey[j];
+                    if (!key) continue;
+                    let val = vals[j].trim();
+                    if (idxType[j] === 'number') val = Number(val) || 0;
+                    if (key === 'length') val = parseDuration(val);
+                    obj[key] = val;
+                }
                 obj['length_display'] = formatLengthJS(obj['length']);
-                newData.push(obj);
-            }}
-            
+                return obj;
+            };
+        }
+
+        // Parses "s", "m:ss" or "h:mm:ss" into seconds by slicing between the colons, without building arrays
+        function parseDuration(val) {
+            const c1 = val.indexOf(':');
+            if (c1 < 0) return +val;
+            const c2 = val.indexOf(':', c1 + 1);
+            if (c2 < 0) return (+val.slice(0, c1)) * 60 + (+val.slice(c1 + 1));
+            if (val.indexOf(':', c2 + 1) >= 0) return val; // more parts than h:mm:ss; kept as text as before
+            return (+val.slice(0, c1)) * 3600 + (+val.slice(c1 + 1, c2)) * 60 + (+val.slice(c2 + 1));
+        }
+
+        // Lowercased label and key -> column, rebuilt only when the columns change
+        let colNameIdx = null;
+        let colNameIdxVersion = -1;
+        function colNameIndex() {
+            if (colNameIdxVersion !== columnsVersion) {
+                colNameIdx = new Map();
+                for (const c of columns) {
+                    // Keep the first match, as a search through columns in order would
+                    const label = c.label.toLowerCase();
+                    const key = c.key.toLowerCase();
+                    if (!colNameIdx.has(label)) colNameIdx.set(label, c);
+                    if (!colNameIdx.has(key)) colNameIdx.set(key, c);
+                }
+                colNameIdxVersion = columnsVersion;
+            }
+            return colNameIdx;
+        }
+
+        function finishImport(newData, modal) {
             audioData = newData;
             processData();
             modal.classList.remove('active');
-            alert(`Imported ${{newData.length}} items.`);
-        }}
+            alert(`Imported ${newData.length} items.`);
+        }
+
+        function splitCSV(str, delimiter) {
+            // Most rows have no quotes at all and are a plain split
+            if (str.indexOf('"') === -1) return str.split(delimiter);
 
-        function splitCSV(str, delimiter) {{
+            // Otherwise scan char codes and copy unquoted runs with slice instead of char by char
             const result = [];
+            const delim = delimiter.charCodeAt(0);
+            const len = str.length;
             let current = '';
+            let start = 0;
             let inQuote = false;
-            for (let i = 0; i < str.length; i++) {{
-                const char = str[i];
-                if (char === '"' && str[i+1] === '"') {{
-                    current += '"'; i++;
-                }} else if (char === '"') {{
-                    inQuote = !inQuote;
-                }} else if (char === delimiter && !inQuote) {{
-                    result.push(current);
+            for (let i = 0; i < len; i++) {
+                const code = str.charCodeAt(i);
+                if (code === 34) { // "
+                    current += str.slice(start, i);
+                    if (str.charCodeAt(i + 1) === 34) { current += '"'; i++; }
+                    else inQuote = !inQuote;
+                    start = i + 1;
+                } else if (code === delim && !inQuote) {
+                    result.push(current + str.slice(start, i));
                     current = '';
-                }} else {{
-                    current += char;
-                }}
-            }}
-            result.push(current);
+                    start = i + 1;
+                }
+            }
+            result.push(current + str.slice(start));
             return result;
-        }}
-
-        function formatLengthJS(seconds) {{
-            if (!seconds) return "0:00";
-            const h = Math.floor(seconds / 3600);
-            const m = Math.floor((seconds % 3600) / 60);
-            const s = Math.floor(seconds % 60);
-            const sStr = s.toString().padStart(2, '0');
-            if (h > 0) return `${{h}}:${{m.toString().padStart(2, '0')}}:${{sStr}}`;
-            return `${{m}}:${{sStr}}`;
-        }}
+        }
+
+        // Two-digit strings for 0-59, so formatting needs no padStart
+        const PAD = Array.from({ length: 60 }, (_, i) => (i < 10 ? '0' : '') + i);
+
+        function formatLengthJS(seconds) {
+            const total = seconds | 0;
+            if (!total) return "0:00";
+            const m = (total / 60) | 0;
+            const s = total - m * 60;
+            if (m < 60) return m + ':' + PAD[s];
+            const h = (m / 60) | 0;
+            return h + ':' + PAD[m - h * 60] + ':' + PAD[s];
+        }
 
         // --- Customize Modal Logic (retained) ---
-        function setupCustomizeModal() {{
+        function setupCustomizeModal() {
             const modal = document.getElementById('modal-customize');
             const list = document.getElementById('column-list-container');
-            document.getElementById('btn-customize').onclick = () => {{
+            setupDragList(list);
+            document.getElementById('btn-customize').onclick = () => {
                 renderDragList(list);
                 modal.classList.add('active');
-            }};
+            };
             document.getElementById('btn-close-modal').onclick = () => modal.classList.remove('active');
-            document.getElementById('btn-save-modal').onclick = () => {{
+            document.getElementById('btn-save-modal').onclick = () => {
                 const items = Array.from(list.children);
                 const newColumns = [];
-                items.forEach(item => {{
+                items.forEach(item => {
                     const key = item.dataset.key;
                     const checkbox = item.querySelector('input[type="checkbox"]');
                     const colConfig = columns.find(c => c.key === key);
-                    if (colConfig) {{
+                    if (colConfig) {
                         colConfig.visible = checkbox.checked;
                         newColumns.push(colConfig);
-                    }}
-                }});
+                    }
+                });
                 columns = newColumns;
+                columnsVersion++;
                 renderTable();
                 modal.classList.remove('active');
-            }};
-        }}
+            };
+        }
 
         let dragSrcEl = null;
-        function renderDragList(container) {{
-            container.innerHTML = '';
-            columns.forEach((col) => {{
-                const div = document.createElement('div');
-                div.className = 'column-item'; div.draggable = true; div.dataset.key = col.key;
-                div.addEventListener('dragstart', handleDragStart);
-                div.addEventListener('dragover', handleDragOver);
-                div.addEventListener('dragenter', handleDragEnter);
-                div.addEventListener('dragleave', handleDragLeave);
-                div.addEventListener('drop', handleDrop);
-                div.addEventListener('dragend', handleDragEnd);
-                const grip = document.createElement('span'); grip.innerHTML = '&#9776;'; grip.style.marginRight = '10px'; grip.style.color = '#666'; grip.style.cursor = 'grab';
-                const checkbox = document.createElement('input'); checkbox.type = 'checkbox'; checkbox.checked = col.visible; checkbox.onmousedown = (e) => e.stopPropagation(); 
-                const label = document.createElement('label'); label.textContent = col.label; label.onclick = () => checkbox.click();
-                div.appendChild(grip); div.appendChild(checkbox); div.appendChild(label); container.appendChild(div);
-            }});
-        }}
-        function handleDragStart(e) {{ dragSrcEl = this; e.dataTransfer.effectAllowed = 'move'; e.dataTransfer.setData('text/html', this.innerHTML); this.classList.add('dragging'); }}
-        function handleDragOver(e) {{ if (e.preventDefault) e.preventDefault(); e.dataTransfer.dropEffect = 'move'; return false; }}
-        function handleDragEnter(e) {{ this.classList.add('over'); }}
-        function handleDragLeave(e) {{ this.classList.remove('over'); }}
-        function handleDrop(e) {{
-            if (e.stopPropagation) e.stopPropagation();
-            if (dragSrcEl !== this) {{
-                const container = this.parentNode;
-                const items = [...container.children];
-                const fromIndex = items.indexOf(dragSrcEl);
-                const toIndex = items.indexOf(this);
-                if (fromIndex < toIndex) container.insertBefore(dragSrcEl, this.nextSibling);
-                else container.insertBefore(dragSrcEl, this);
-            }}
-            return false;
-        }}
-        function handleDragEnd(e) {{ this.classList.remove('dragging'); this.parentNode.querySelectorAll('.column-item').forEach(i => i.classList.remove('over')); }}
+        function renderDragList(container) {
+            container.innerHTML = columns.map(col => {
+                const key = escapeHtml(col.key);
+                return `<div class="column-item" draggable="true" data-key="${key}">` +
+                    `<span style="margin-right:10px; color:#666; cursor:grab">&#9776;</span>` +
+                    `<input type="checkbox" id="customize-col-${key}"${col.visible ? ' checked' : ''}>` +
+                    `<label for="customize-col-${key}">${escapeHtml(col.label)}</label></div>`;
+            }).join('');
+        }
+
+        // Drag events bubble, so the list container handles them for every item
+        function setupDragList(container) {
+            const itemOf = (e) => {
+                const el = e.target.nodeType === 1 ? e.target : e.target.parentElement;
+                return el ? el.closest('.column-item') : null;
+            };
+            container.addEventListener('dragstart', (e) => {
+                const item = itemOf(e);
+                if (!item) return;
+                dragSrcEl = item;
+                e.dataTransfer.effectAllowed = 'move';
+                e.dataTransfer.setData('text/html', item.innerHTML);
+                item.classList.add('dragging');
+            });
+            container.addEventListener('dragover', (e) => {
+                if (!itemOf(e)) return;
+                e.preventDefault();
+                e.dataTransfer.dropEffect = 'move';
+            });
+            container.addEventListener('dragenter', (e) => {
+                const item = itemOf(e);
+                if (item) item.classList.add('over');
+            });
+            container.addEventListener('dragleave', (e) => {
+                const item = itemOf(e);
+                if (item) item.classList.remove('over');
+            });
+            container.addEventListener('drop', (e) => {
+                const item = itemOf(e);
+                if (!item) return;
+                e.stopPropagation();
+                e.preventDefault();
+                if (dragSrcEl && dragSrcEl !== item) {
+                    const items = [...container.children];
+                    const fromIndex = items.indexOf(dragSrcEl);
+                    const toIndex = items.indexOf(item);
+                    if (fromIndex < toIndex) container.insertBefore(dragSrcEl, item.nextSibling);
+                    else container.insertBefore(dragSrcEl, item);
+                }
+            });
+            container.addEventListener('dragend', (e) => {
+                const item = itemOf(e);
+                if (item) item.classList.remove('dragging');
+                container.querySelectorAll('.column-item').forEach(i => i.classList.remove('over'));
+            });
+        }
     </script>
 </body>
 </html>"""
 
-    return html_template.format(json_data=json_data)
+# Strips comments and insignificant whitespace from a stylesheet
+# @param {str} css 
+# @returns {str}
+def _minify_css(css):
+    css = re.sub(r'/\*.*?\*/', '', css, flags=re.S)
+    css = re.sub(r'\s+', ' ', css)
+    return re.sub(r'\s*([{};:,>])\s*', r'\1', css).strip()
+
+# The stylesheet is minified and the template split once at import instead of on every export
+_CSS_START = HTML_TEMPLATE.index("<style>") + len("<style>")
+_CSS_END = HTML_TEMPLATE.index("</style>")
+_HTML_PREFIX, _HTML_SUFFIX = (
+    part.encode("utf-8")
+    for part in (
+        HTML_TEMPLATE[:_CSS_START] + _minify_css(HTML_TEMPLATE[_CSS_START:_CSS_END]) + HTML_TEMPLATE[_CSS_END:]
+    ).split("{json_data}")
+)
+
+# Serializes a value to UTF-8 JSON
+# @param {any} value 
+# @returns {bytes}
+def _to_json(value):
+    if orjson is not None:
+        try:
+            return orjson.dumps(value)
+        except TypeError:
+            # orjson only handles 64-bit integers; an all-digit tag (e.g. a mangled track number) can be bigger
+            pass
+    # ensure_ascii=False writes actual unicode characters instead of \u escapes
+    return json.dumps(value, ensure_ascii=False).encode("utf-8")
+
+# Formats a whole column of lengths, each distinct whole-second value only once
+# The float lengths are almost all distinct, but once truncated to whole seconds most tracks
+# fall within a few hundred values, so the memo is keyed on the truncated value
+# @param {list} lengths - Lengths in seconds
+# @returns {list} - Display strings in the same order
+def _format_lengths(lengths):
+    formatted = {}
+    result = []
+    for seconds in lengths:
+        seconds = int(seconds) if seconds else 0
+        text = formatted.get(seconds)
+        if text is None:
+            text = formatted[seconds] = format_length(seconds)
+        result.append(text)
+    return result
+
+# Writes the HTML page with embedded JSON data and JS logic
+# The data is built column by column ({key: [value per track]}) so each key name appears once,
+# gzipped as it is produced and embedded as base64; the page inflates it with DecompressionStream
+# @param {list} metadata_list 
+# @param {str} out_path 
+def write_html(metadata_list, out_path):
+    packer = zlib.compressobj(9, zlib.DEFLATED, 31)  # wbits=31 -> gzip container
+    packed = [packer.compress(b"{")]
+    for key in EXPORT_KEYS:
+        packed.append(packer.compress(_to_json(key) + b":" + _to_json([m.get(key) for m in metadata_list]) + b","))
+    packed.append(packer.compress(b'"length_display":' + _to_json(_format_lengths([m['length'] for m in metadata_list])) + b"}"))
+    packed.append(packer.flush())
+
+    with open(out_path, "wb", buffering=1024 * 1024) as fh:
+        fh.write(_HTML_PREFIX)
+        # Base64 has no "<", so no tag value can end the script element early
+        fh.write(base64.b64encode(b"".join(packed)))
+        fh.write(_HTML_SUFFIX)
+
+# argparse type for counts that must be at least 1
+# @param {str} value 
+# @returns {int}
+def _positive_int(value):
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid number: {value!r}")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
 
 def main():
-    folder_path = input("Enter the path to the folder to scan: ").strip()
-
-    if folder_path.startswith('"') and folder_path.endswith('"'):
-        folder_path = folder_path[1:-1]
+    parser = argparse.ArgumentParser(description="Generates a sortable HTML table of the audio files in a folder.")
+    parser.add_argument("folder", nargs="?",
+                        help="folder to scan (prompted for when omitted)")
+    parser.add_argument("-o", "--output", default="output.html",
+                        help="HTML file to write (default: output.html)")
+    parser.add_argument("-j", "--workers", type=_positive_int, default=None,
+                        help="number of worker processes, or threads with --threads, used to read metadata "
+                             "(default: one process per CPU, or min(32, 4 x CPUs) threads)")
+    parser.add_argument("--threads", action="store_true",
+                        help="read metadata in threads instead of processes (faster on network shares)")
+    parser.add_argument("--no-cache", action="store_true",
+                        help=f"parse every file instead of reusing metadata saved in {CACHE_FILE}")
+    args = parser.parse_args()
+
+    logging.basicConfig(format="%(message)s")
+
+    folder_path = args.folder
+    if folder_path is None:
+        # Paths copied from Explorer/Finder are often wrapped in quotes
+        folder_path = input("Enter the path to the folder to scan: ").strip().strip('"')
 
     folder_path = os.path.normpath(folder_path)
 
@@ -1043,14 +1726,16 @@ def main():
     print(f"Scanning folder: {folder_path}")
 
     print("Scanning for audio files...")
-    metadata_list = collect_metadata(folder_path)
+    cache = None if args.no_cache else open_cache(CACHE_FILE)
+    try:
+        metadata_list = collect_metadata(folder_path, args.workers, cache, args.threads)
+    finally:
+        if cache is not None:
+            cache.close()
     print(f"Found {len(metadata_list)} audio files.")
 
-    html_output = generate_html(metadata_list)
-
-    output_file = "output.html"
-    with open(output_file, "w", encoding="utf-8") as f:
-        f.write(html_output)
+    output_file = args.output
+    write_html(metadata_list, output_file)
 
     print(f"Metadata table written to {output_file}")
 